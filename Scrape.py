@@ -1,84 +1,159 @@
+import asyncio
+import io
+import time
+
 import streamlit as st
-from bs4 import BeautifulSoup
-import requests
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
+import numpy as np
 import pandas as pd
-import re
-from typing import Union, List, Dict
-import sys
+from typing import List, Tuple, Union
+
+# Add a user-agent to the request to avoid being blocked by some websites. # Line 9
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+# Selector for the tags _fetch strips before text extraction. # Line 12
+_STRIP_SELECTOR = 'script,style'
+
+# Per-URL page cache settings (seconds / entries). # Line 15
+_CACHE_TTL = 600
+_CACHE_MAX_ENTRIES = 128
+
 
-def scrape_webpage(url: str) -> Union[str, None]:
+@st.cache_resource(show_spinner=False)
+def _page_cache() -> dict:
     """
-    Scrapes the text content from a given URL.
+    Returns the per-URL text cache, shared across Streamlit reruns.
+    Maps url -> (fetch time, text).
+    """
+    return {}
+
+
+async def _fetch(url: str, session: aiohttp.ClientSession) -> Union[str, Exception]:
+    """
+    Fetches one URL and extracts its text content with selectolax's
+    Lexbor parser, which strips script/style and pulls the text entirely
+    in C with no per-node Python proxies.
 
     Args:
         url (str): The URL of the webpage to scrape.
+        session (aiohttp.ClientSession): The shared session to fetch with.
 
     Returns:
-        str: The text content of the webpage, or None if an error occurs.
+        Union[str, Exception]: The text content of the webpage, or the
+        exception that occurred, so the caller can report the reason.
     """
     try:
-        # Add a user-agent to the request to avoid being blocked by some websites. # Line 8
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
-        response = requests.get(url, headers=headers, timeout=10)  # Set a timeout
-        response.raise_for_status()  # Raise an exception for bad status codes
-
-        soup = BeautifulSoup(response.content, 'html.parser')
-        # Remove script and style tags to get only the meaningful text # Line 14
-        for script_or_style in soup.find_all(['script', 'style']):
-            script_or_style.decompose()
-        text = soup.get_text(separator='\n', strip=True)  # Use \n as separator and strip text
-        return text
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching URL: {e}")
-        return None
+        async with session.get(url) as response:
+            response.raise_for_status()  # Raise an exception for bad status codes
+            content = await response.read()
+        tree = LexborHTMLParser(content)
+        for tag in tree.css(_STRIP_SELECTOR):
+            tag.decompose()
+        return tree.body.text(separator='\n', strip=True) if tree.body else ''
     except Exception as e:
-        st.error(f"An unexpected error occurred: {e}")
-        return None
+        return e
+
 
+async def _fetch_all(urls: Tuple[str, ...]) -> List[Union[str, Exception]]:
+    """
+    Fetches every URL concurrently over one shared keep-alive session.
+    """
+    connector = aiohttp.TCPConnector(limit=20)
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=HEADERS) as session:
+        return await asyncio.gather(*(_fetch(url, session) for url in urls))
 
 
-def extract_data(text: str) -> List[Dict[str, Union[str, int, float]]]:
+def scrape_webpages(urls: Tuple[str, ...]) -> List[Union[str, Exception]]:
     """
-    Extracts data from the text, attempting to identify different data types.
+    Scrapes the text content of the given URLs concurrently.
+
+    Results are memoized per URL, so a URL that was scraped recently is
+    free regardless of which batch it appears in; only cache misses are
+    fetched, concurrently, at roughly one round trip of wall time.
+    Failures are not cached, so a bad URL is retried on the next run.
+    Error reporting is left to the caller via the exception entries.
 
     Args:
-        text (str): The text to extract data from.
+        urls (Tuple[str, ...]): The URLs of the webpages to scrape.
 
     Returns:
-        List[Dict[str, Union[str, int, float]]]: A list of dictionaries, where each dictionary
-        represents a data entry with 'type' and 'value' keys.
+        List[Union[str, Exception]]: The text content per URL, in order,
+        with the exception for any URL that failed.
     """
-    data_list = []
-    lines = text.split('\n')  # Split the text into lines # Line 31
-
-    for line in lines:
-        line = line.strip()  # Remove leading/trailing whitespace
-        if not line:
-            continue  # Skip empty lines
-
-        # Attempt to identify data type and extract value # Line 37
-        if re.match(r'^\d+$', line):
-            data_list.append({'type': 'integer', 'value': int(line)})
-        elif re.match(r'^\d+\.\d+$', line):
-            data_list.append({'type': 'float', 'value': float(line)})
+    cache = _page_cache()
+    now = time.monotonic()
+    results = {}
+    for url in urls:
+        entry = cache.get(url)
+        if entry is None:
+            continue
+        if now - entry[0] <= _CACHE_TTL:
+            results[url] = entry[1]
         else:
-            data_list.append({'type': 'string', 'value': line})
+            del cache[url]  # Expired; drop it rather than wait for the cap
 
-    return data_list
+    misses = tuple(url for url in dict.fromkeys(urls) if url not in results)
+    if misses:
+        for url, result in zip(misses, asyncio.run(_fetch_all(misses))):
+            results[url] = result
+            if isinstance(result, str):
+                # Re-insert so dict order tracks recency (plain assignment
+                # keeps the original slot on refresh). # Line 101
+                cache.pop(url, None)
+                cache[url] = (now, result)
+        # Evict least-recently-refreshed entries once over the cap # Line 104
+        while len(cache) > _CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
 
+    return [results[url] for url in urls]
 
 
-def preprocess_data(data: List[Dict[str, Union[str, int, float]]]) -> pd.DataFrame:
+
+def extract_data(text: str) -> pd.DataFrame:
     """
-    Preprocesses the extracted data and converts it into a Pandas DataFrame.
+    Extracts data from the text, attempting to identify different data types.
 
     Args:
-        data (List[Dict[str, Union[str, int, float]]]): The data to preprocess.
+        text (str): The text to extract data from.
 
     Returns:
-        pd.DataFrame: A Pandas DataFrame representing the preprocessed data.
+        pd.DataFrame: A DataFrame with 'type' and 'value' columns, one row
+        per non-empty line of the text.
     """
-    df = pd.DataFrame(data)
+    # Build one Series of stripped, non-empty lines and classify it in
+    # vectorized C passes instead of a per-line Python loop. splitlines()
+    # handles \r and the other Unicode line breaks in a single C pass. # Line 31
+    s = pd.Series(text.splitlines(), dtype='object').str.strip()
+    s = s[s.astype(bool)].reset_index(drop=True)
+
+    # pandas' C numeric parser validates and converts in one pass:
+    # non-numeric lines coerce to NaN, signs and exponents come for free.
+    # Int-ness is decided from the string itself -- exponent forms like
+    # 2e-3 or 1e5 contain no dot but int() would reject them, so anything
+    # numeric that isn't pure (signed) digits is a float. # Line 37
+    numeric = pd.to_numeric(s, errors='coerce')
+    is_num = numeric.notna()
+    is_int = is_num & s.str.fullmatch(r'[+-]?\d+').astype(bool)
+    is_float = is_num & ~is_int
+
+    values = s.astype('object')
+    # Convert integers from the strings themselves -- numeric is float64
+    # (prose lines coerce to NaN), which silently rounds past 2**53 and
+    # cannot represent digit strings beyond int64 at all. int() is exact
+    # at any width. The RHS must be object dtype: masked setitem upcasts
+    # an int64 RHS through float64, turning 42 into 42.0. # Line 41
+    values[is_int] = s[is_int].map(int).astype('object')
+    values[is_float] = numeric[is_float].astype('object')
+
+    df = pd.DataFrame({
+        'type': np.where(is_int, 'integer', np.where(is_float, 'float', 'string')),
+        'value': values,
+    }, copy=False)
+    # One byte per row instead of an object pointer per row; comparisons and
+    # groupby on 'type' run on the integer codes. # Line 45
+    df['type'] = df['type'].astype(pd.CategoricalDtype(['integer', 'float', 'string']))
     return df
 
 
@@ -89,47 +164,72 @@ def main():
     """
     st.title("Web Scraper and Data Preprocessor")
 
-    url = st.text_input("Enter the URL of the webpage to scrape:")
+    urls_input = st.text_area("Enter the URL(s) of the webpages to scrape (one per line):")
 
     if st.button("Scrape and Preprocess"): # Line 70
-        if not url:
+        urls = tuple(u.strip() for u in urls_input.splitlines() if u.strip())
+        if not urls:
             st.error("Please enter a URL.")
             return
 
         st.spinner("Scraping and processing data...")
-        text_content = scrape_webpage(url)
+        texts = scrape_webpages(urls)
+        for url, text in zip(urls, texts):
+            if not isinstance(text, str):
+                st.error(f"Error fetching {url}: {text}")
+        text_content = '\n'.join(t for t in texts if isinstance(t, str) and t)
         if text_content:
-            extracted_data = extract_data(text_content)
-            df = preprocess_data(extracted_data)
+            df = extract_data(text_content)
+            if df.empty:
+                # Skip the tabs and dataframe widgets entirely; each one
+                # would serialize and ship the empty frame to the browser. # Line 79
+                st.warning("No extractable data.")
+                st.subheader("Raw Text")
+                st.text(text_content)
+                return
             st.subheader("Extracted Data:")
             tab1, tab2, tab3, tab4, tab5 = st.tabs(["All Data", "Integers", "Floats", "Strings", "Merged"]) # Line 80
 
+            # Partition by type once instead of three boolean-mask scans # Line 81
+            groups = dict(tuple(df.groupby('type', sort=False, observed=True)))
+            empty = df.iloc[:0]
+            int_df = groups.get('integer', empty)
+            float_df = groups.get('float', empty)
+            string_df = groups.get('string', empty)
+
             with tab1:
                 st.dataframe(df)
-                st.write(f"Total size: {sys.getsizeof(df.to_string().encode('utf-8'))/1024:.2f} KB") # Line 84
+                st.write(f"Total size: {df.memory_usage(deep=True).sum()/1024:.2f} KB") # Line 84
             with tab2:
-                int_df = df[df['type'] == 'integer']
                 st.dataframe(int_df)
-                st.write(f"Integers size: {sys.getsizeof(int_df.to_string().encode('utf-8'))/1024:.2f} KB") # Line 88
+                st.write(f"Integers size: {int_df.memory_usage(deep=True).sum()/1024:.2f} KB") # Line 88
             with tab3:
-                float_df = df[df['type'] == 'float']
                 st.dataframe(float_df)
-                st.write(f"Floats size: {sys.getsizeof(float_df.to_string().encode('utf-8'))/1024:.2f} KB") # Line 92
+                st.write(f"Floats size: {float_df.memory_usage(deep=True).sum()/1024:.2f} KB") # Line 92
             with tab4:
-                string_df = df[df['type'] == 'string']
                 st.dataframe(string_df)
-                st.write(f"Strings size: {sys.getsizeof(string_df.to_string().encode('utf-8'))/1024:.2f} KB") # Line 96
+                st.write(f"Strings size: {string_df.memory_usage(deep=True).sum()/1024:.2f} KB") # Line 96
             with tab5: # Line 97
                 if st.checkbox("Merge all data types"):
-                    merged_df = pd.concat([int_df, float_df, string_df])
+                    # The groups partition df, so the merge is df itself # Line 98
+                    merged_df = df
                     st.dataframe(merged_df)
-                    st.write(f"Merged size: {sys.getsizeof(merged_df.to_string().encode('utf-8'))/1024:.2f} KB")
+                    st.write(f"Merged size: {merged_df.memory_usage(deep=True).sum()/1024:.2f} KB")
+
+            # Write the CSV straight into a byte buffer in chunks, so no
+            # full-table str intermediate is ever materialized. # Line 103
+            csv_buf = io.BytesIO()
+            df.to_csv(csv_buf, index=False, encoding='utf-8', chunksize=10000)
+            csv_size_kb = csv_buf.getbuffer().nbytes / 1024
+            csv_buf.seek(0)
+            st.download_button("Download CSV", data=csv_buf, file_name="scraped_data.csv", mime="text/csv")
+            st.write(f"CSV size: {csv_size_kb:.2f} KB")
 
             st.subheader("Raw Text")
             st.text(text_content)
-            st.write(f"Raw Text size : {sys.getsizeof(text_content.to_string().encode('utf-8'))/1024:.2f} KB")
+            st.write(f"Raw Text size : {len(text_content.encode('utf-8'))/1024:.2f} KB")
         else:
-            st.error("Failed to scrape data from the webpage.")
+            st.error("Failed to scrape data from the webpage(s).")
 
 if __name__ == "__main__":
     main()